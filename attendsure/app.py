@@ -1,19 +1,41 @@
 from __future__ import annotations
 
 import logging
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
-from .db import init_db
+from .db import dispose_engine, get_engine
 from .routers_calls import router as calls_router
 from .routers_contacts import router as contacts_router
 from .routers_webhooks import router as webhooks_router
-from .settings import settings
+from .services_launcher import get_launcher
+from .settings import get_settings
+from .vapi import aclose_client, get_client
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    # Shared resources are built once per worker here rather than at import time.
+    # Schema creation is not done here; run `python -m attendsure.manage init-db`.
+    get_engine()
+    get_client()
+    get_launcher()
+    try:
+        yield
+    finally:
+        await aclose_client()
+        dispose_engine()
+        # The launcher's semaphore is bound to this event loop; rebuild it for the next lifespan
+        get_launcher.cache_clear()
 
 
 def create_app() -> FastAPI:
-    init_db()
-    app = FastAPI(title="AttendSure API")
+    """App factory: `uvicorn --factory attendsure.app:create_app`."""
+    settings = get_settings()
+    app = FastAPI(title="AttendSure API", lifespan=lifespan)
     logging.basicConfig(level=logging.INFO)
 
     app.add_middleware(
@@ -34,6 +56,15 @@ def create_app() -> FastAPI:
     return app
 
 
-app = create_app()
+_app: FastAPI | None = None
 
 
+def __getattr__(name: str) -> Any:
+    # `attendsure.app:app` keeps working, but importing this module no longer
+    # builds the app or reads .env; that happens on first access instead.
+    global _app
+    if name == "app":
+        if _app is None:
+            _app = create_app()
+        return _app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,33 +1,42 @@
 from contextlib import contextmanager
+from functools import lru_cache
 from typing import Iterator
 
+from sqlalchemy.engine import Engine
 from sqlmodel import SQLModel, Session, create_engine
 
-from .settings import settings
+from .settings import get_settings
 
 
-def _create_engine():
-    connect_args = {"check_same_thread": False} if settings.database_url.startswith("sqlite") else {}
-    return create_engine(settings.database_url, echo=False, connect_args=connect_args)
+@lru_cache(maxsize=1)
+def get_engine() -> Engine:
+    """Build the engine on first use; later calls reuse the same instance."""
+    database_url = get_settings().database_url
+    connect_args = {"check_same_thread": False} if database_url.startswith("sqlite") else {}
+    return create_engine(database_url, echo=False, connect_args=connect_args)
 
 
-engine = _create_engine()
+def dispose_engine() -> None:
+    if get_engine.cache_info().currsize:
+        get_engine().dispose()
+        get_engine.cache_clear()
 
 
 def init_db() -> None:
+    """Create all tables. Run via `python -m attendsure.manage init-db`, not at app startup."""
     from . import models  # noqa: F401  Ensures models are imported for metadata
 
-    SQLModel.metadata.create_all(engine)
+    SQLModel.metadata.create_all(get_engine())
 
 
 def get_session() -> Iterator[Session]:
-    with Session(engine) as session:
+    with Session(get_engine()) as session:
         yield session
 
 
 @contextmanager
 def session_scope() -> Iterator[Session]:
-    session = Session(engine)
+    session = Session(get_engine())
     try:
         yield session
         session.commit()
@@ -36,5 +45,3 @@ def session_scope() -> Iterator[Session]:
         raise
     finally:
         session.close()
-
-
@@ -0,0 +1,161 @@
+"""Management commands.
+
+    python -m attendsure.manage init-db
+    python -m attendsure.manage bench-startup [--runs N]
+    python -m attendsure.manage bench-dispatch [--calls N] [--latency-ms MS]
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import uuid
+from typing import Dict, List, Optional
+
+
+# Runs in a fresh interpreter so every sample is a true cold start.
+_STARTUP_PROBE = """
+import asyncio, json, time
+t0 = time.perf_counter()
+from attendsure.app import create_app
+app = create_app()
+t1 = time.perf_counter()
+
+async def _startup():
+    async with app.router.lifespan_context(app):
+        return time.perf_counter()
+
+t2 = asyncio.run(_startup())
+print(json.dumps({"import_ms": (t1 - t0) * 1000, "lifespan_ms": (t2 - t1) * 1000}))
+"""
+
+
+def _positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError("must be >= 1")
+    return number
+
+
+def init_db_command(args: argparse.Namespace) -> int:
+    from .db import init_db
+
+    init_db()
+    print("Database schema created")
+    return 0
+
+
+def bench_startup_command(args: argparse.Namespace) -> int:
+    samples: List[Dict[str, float]] = []
+    for _ in range(args.runs):
+        out = subprocess.run(
+            [sys.executable, "-c", _STARTUP_PROBE],
+            capture_output=True,
+            text=True,
+        )
+        if out.returncode != 0:
+            print(out.stderr, file=sys.stderr, end="")
+            print(f"Startup probe failed with exit code {out.returncode}", file=sys.stderr)
+            return out.returncode
+        samples.append(json.loads(out.stdout.strip().splitlines()[-1]))
+
+    for key in ("import_ms", "lifespan_ms"):
+        values = [s[key] for s in samples]
+        print(f"{key:<12} min={min(values):8.1f}  median={statistics.median(values):8.1f}  max={max(values):8.1f}")
+    totals = [s["import_ms"] + s["lifespan_ms"] for s in samples]
+    print(f"{'total_ms':<12} min={min(totals):8.1f}  median={statistics.median(totals):8.1f}  max={max(totals):8.1f}")
+    return 0
+
+
+async def _dispatch_once(calls: int, latency_s: float, use_batch: bool, database_url: str) -> float:
+    import httpx
+
+    from . import vapi
+    from .db import dispose_engine, init_db, session_scope
+    from .repositories import create_call_records
+    from .services_launcher import CallLauncher, PendingCall
+    from .settings import get_settings
+
+    settings = get_settings()
+    settings.database_url = database_url
+    settings.use_vapi_batch = use_batch
+    settings.vapi_api_key = settings.vapi_api_key or "bench"
+    dispose_engine()
+    init_db()
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        # Simulated provider round-trip; bulk requests cost one round-trip per batch
+        await asyncio.sleep(latency_s)
+        body = json.loads(request.content)
+        if "customers" in body:
+            results = [{"id": str(uuid.uuid4()), "customer": customer} for customer in body["customers"]]
+            return httpx.Response(201, json={"results": results, "errors": []})
+        return httpx.Response(201, json={"id": str(uuid.uuid4())})
+
+    # Swap the shared client for one backed by the mock transport
+    await vapi.aclose_client()
+    vapi._client = httpx.AsyncClient(base_url=vapi.VAPI_BASE, transport=httpx.MockTransport(handler))
+
+    with session_scope() as session:
+        call_ids = create_call_records(session, list(range(1, calls + 1)))
+    pending = [
+        PendingCall(call_id=call_id, phone=f"+1555{call_id:07d}", variable_values={"name": f"Patient {call_id}"})
+        for call_id in call_ids
+    ]
+
+    started = time.perf_counter()
+    await CallLauncher().launch_calls(pending, assistant_id=settings.vapi_assistant_id or "bench")
+    elapsed = time.perf_counter() - started
+
+    await vapi.aclose_client()
+    dispose_engine()
+    return elapsed
+
+
+def bench_dispatch_command(args: argparse.Namespace) -> int:
+    import logging
+
+    from .settings import get_settings
+
+    logging.disable(logging.INFO)
+    settings = get_settings()
+    print(
+        f"calls={args.calls} latency_ms={args.latency_ms} "
+        f"concurrency_limit={settings.concurrency_limit} batch_size={settings.vapi_batch_size}"
+    )
+    with tempfile.TemporaryDirectory() as tmp:
+        for mode, use_batch in (("single", False), ("bulk", True)):
+            database_url = f"sqlite:///{os.path.join(tmp, f'{mode}.db')}"
+            elapsed = asyncio.run(_dispatch_once(args.calls, args.latency_ms / 1000, use_batch, database_url))
+            print(f"{mode:<8} {elapsed:8.2f}s  {args.calls / elapsed:10.1f} calls/s")
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m attendsure.manage")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    init_db = sub.add_parser("init-db", help="Create database tables")
+    init_db.set_defaults(func=init_db_command)
+
+    bench = sub.add_parser("bench-startup", help="Measure cold import + lifespan startup time")
+    bench.add_argument("--runs", type=_positive_int, default=10)
+    bench.set_defaults(func=bench_startup_command)
+
+    dispatch = sub.add_parser("bench-dispatch", help="Measure launch dispatch time against a mock Vapi transport")
+    dispatch.add_argument("--calls", type=_positive_int, default=1000)
+    dispatch.add_argument("--latency-ms", type=_positive_int, default=100)
+    dispatch.set_defaults(func=bench_dispatch_command)
+
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
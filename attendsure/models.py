@@ -26,7 +26,7 @@ class Call(SQLModel, table=True):
     id: Optional[int] = Field(default=None, primary_key=True)
     patient_id: int = Field(foreign_key="patients.id")
     vapi_call_id: Optional[str] = Field(default=None, unique=True, index=True)
-    status: str = Field(default="queued", description="queued|in_progress|completed|failed")
+    status: str = Field(default="queued", description="queued|in_progress|completed|failed|unknown")
     scheduled_at: Optional[str] = None
     started_at: Optional[str] = None
     ended_at: Optional[str] = None
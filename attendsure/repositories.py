@@ -3,6 +3,7 @@ from __future__ import annotations
 import json
 from typing import Any, Dict, List, Optional, Tuple
 
+from sqlalchemy import update
 from sqlmodel import Session, select
 
 from .models import Call, CallResult, Patient
@@ -48,16 +49,23 @@ def list_patients(session: Session, limit: int = 100, offset: int = 0) -> List[P
     return list(result)
 
 
-def create_call_record(
+def create_call_records(
     session: Session,
-    patient_id: int,
+    patient_ids: List[int],
     scheduled_at: Optional[str] = None,
-) -> Call:
-    call = Call(patient_id=patient_id, scheduled_at=scheduled_at)
-    session.add(call)
+) -> List[int]:
+    calls = [Call(patient_id=patient_id, scheduled_at=scheduled_at) for patient_id in patient_ids]
+    session.add_all(calls)
+    session.flush()
+    # Read ids before commit expires the instances, avoiding a reload per row
+    call_ids = [call.id for call in calls]
     session.commit()
-    session.refresh(call)
-    return call
+    return call_ids
+
+
+def get_patients_by_ids(session: Session, patient_ids: List[int]) -> Dict[int, Patient]:
+    patients = session.exec(select(Patient).where(Patient.id.in_(patient_ids))).all()
+    return {patient.id: patient for patient in patients}
 
 
 def mark_call_launched(
@@ -80,16 +88,33 @@ def mark_call_launched(
     return call
 
 
-def mark_call_failed(session: Session, call_id: int, reason: str) -> Call:
-    call = session.get(Call, call_id)
-    if not call:
-        raise ValueError(f"Call {call_id} not found")
-    call.status = "failed"
-    call.fail_reason = reason
-    session.add(call)
+def mark_calls_launched(
+    session: Session,
+    vapi_call_ids: Dict[int, Optional[str]],
+    status: str = "in_progress",
+) -> None:
+    """Set vapi_call_id/status for many calls in one executemany UPDATE keyed by call id."""
+    if not vapi_call_ids:
+        return
+    session.exec(
+        update(Call),
+        params=[
+            {"id": call_id, "vapi_call_id": vapi_call_id, "status": status}
+            for call_id, vapi_call_id in vapi_call_ids.items()
+        ],
+    )
+    session.commit()
+
+
+def mark_calls_status(session: Session, reasons: Dict[int, str], status: str) -> None:
+    """Set status and fail_reason for many calls in one executemany UPDATE keyed by call id."""
+    if not reasons:
+        return
+    session.exec(
+        update(Call),
+        params=[{"id": call_id, "status": status, "fail_reason": reason} for call_id, reason in reasons.items()],
+    )
     session.commit()
-    session.refresh(call)
-    return call
 
 
 def update_call_status_by_vapi_id(
@@ -8,31 +8,21 @@ from fastapi import APIRouter, Depends, HTTPException
 from sqlmodel import Session
 
 from .db import get_session
-from .models import Patient
 from .repositories import (
-    create_call_record,
+    create_call_records,
     get_call_detail,
     get_calls_joined,
+    get_patients_by_ids,
 )
-from .services_launcher import launcher
-from .settings import settings
+from .services_launcher import PendingCall, get_launcher
+from .settings import get_settings
+from .vapi import normalize_e164
 
 
 router = APIRouter(prefix="/api/calls", tags=["calls"])
 logger = logging.getLogger("attendsure.calls")
 
 
-def _normalize_e164(candidate: str) -> str:
-    c = (candidate or "").strip()
-    # If it already starts with '+', assume correct
-    if c.startswith('+'):
-        return c
-    # If it looks like digits only and 10-15 length, prefix '+'
-    if c.isdigit() and 8 <= len(c) <= 15:
-        return '+' + c
-    return c
-
-
 @router.post("/launch")
 async def launch_calls(payload: Dict[str, Any], session: Session = Depends(get_session)):
     logger.info("Launch calls payload: %s", payload)
@@ -42,14 +32,16 @@ async def launch_calls(payload: Dict[str, Any], session: Session = Depends(get_s
     if not patient_ids:
         raise HTTPException(status_code=400, detail="patientIds is required")
 
-    call_ids: List[int] = []
+    settings = get_settings()
+    patients = get_patients_by_ids(session, patient_ids)
     for patient_id in patient_ids:
-        patient = session.get(Patient, patient_id)
-        if not patient:
+        if patient_id not in patients:
             raise HTTPException(status_code=404, detail=f"Patient {patient_id} not found")
-        call = create_call_record(session, patient_id=patient_id, scheduled_at=schedule_at)
-        call_ids.append(call.id)
 
+    # Build launch inputs before inserting calls; the commit expires the loaded patients
+    launch_inputs = []
+    for patient_id in patient_ids:
+        patient = patients[patient_id]
         variable_values = {
             # legacy keys (still sending for backward compat in your assistant)
             "name": patient.name,
@@ -64,24 +56,33 @@ async def launch_calls(payload: Dict[str, Any], session: Session = Depends(get_s
             "dob": patient.dob,
             "doctor": patient.doctor_name,
         }
-
-        metadata = {"patientId": patient.id, "callId": call.id}
-
-        # Schedule or immediate launch via launcher (throttled)
-        logger.info("Queue launch call -> patientId=%s callId=%s phone=%s assistant=%s", 
-                   patient_id, call.id, _normalize_e164(patient.phone), settings.vapi_assistant_id)
-        logger.info("Variable values: %s", variable_values)
-        asyncio.create_task(
-            launcher.launch_call(
-                call_id=call.id,
-                phone=_normalize_e164(patient.phone),
-                assistant_id=settings.vapi_assistant_id,
+        launch_inputs.append((patient_id, normalize_e164(patient.phone), variable_values))
+
+    call_ids = create_call_records(session, patient_ids, scheduled_at=schedule_at)
+
+    pending: List[PendingCall] = []
+    for call_id, (patient_id, phone, variable_values) in zip(call_ids, launch_inputs):
+        logger.info("Queue launch call -> patientId=%s callId=%s phone=%s assistant=%s",
+                    patient_id, call_id, phone, settings.vapi_assistant_id)
+        logger.debug("Variable values: %s", variable_values)
+        pending.append(
+            PendingCall(
+                call_id=call_id,
+                phone=phone,
                 variable_values=variable_values,
-                schedule_at=schedule_at,
-                metadata=metadata,
+                metadata={"patientId": patient_id, "callId": call_id},
             )
         )
 
+    # Schedule or immediate launch via launcher (batched and throttled)
+    asyncio.create_task(
+        get_launcher().launch_calls(
+            pending,
+            assistant_id=settings.vapi_assistant_id,
+            schedule_at=schedule_at,
+        )
+    )
+
     return {"callIds": call_ids}
 
 
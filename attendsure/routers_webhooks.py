@@ -9,7 +9,7 @@ from sqlmodel import Session
 
 from .db import get_session
 from .repositories import find_call_by_vapi_id, insert_result_for_call, update_call_status_by_vapi_id
-from .settings import settings
+from .settings import get_settings
 
 
 router = APIRouter(tags=["webhooks"])
@@ -22,8 +22,9 @@ async def vapi_end_of_call(
     session: Session = Depends(get_session),
     x_vapi_signature: Optional[str] = Header(default=None, alias="X-Vapi-Signature"),
 ):
-    if settings.webhook_secret:
-        if not x_vapi_signature or x_vapi_signature != settings.webhook_secret:
+    webhook_secret = get_settings().webhook_secret
+    if webhook_secret:
+        if not x_vapi_signature or x_vapi_signature != webhook_secret:
             raise HTTPException(status_code=401, detail="Invalid webhook signature")
 
     payload: Dict[str, Any] = await request.json()
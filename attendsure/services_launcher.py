@@ -1,67 +1,223 @@
 from __future__ import annotations
 
 import asyncio
+from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
 from datetime import datetime, timezone
+from functools import lru_cache
 
+import httpx
 import logging
 from .db import session_scope
-from .repositories import mark_call_failed, mark_call_launched
-from .settings import settings
-from .vapi import create_outbound_call
+from .repositories import mark_call_launched, mark_calls_launched, mark_calls_status
+from .settings import get_settings
+from .vapi import create_outbound_call, create_outbound_calls_batch, normalize_e164
+
+
+@dataclass
+class PendingCall:
+    call_id: int
+    phone: str
+    variable_values: Dict[str, Any]
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+
+# Endpoint missing: bulk is unavailable for this provider, stop trying for the process lifetime
+_BATCH_UNSUPPORTED_STATUSES = {404, 405}
+# Request rejected as a whole (e.g. one invalid number): retry this batch as single requests
+_BATCH_REJECTED_STATUSES = {400, 422}
 
 
 class CallLauncher:
     def __init__(self) -> None:
-        self._semaphore = asyncio.Semaphore(settings.concurrency_limit)
+        self._semaphore = asyncio.Semaphore(get_settings().concurrency_limit)
         self._logger = logging.getLogger("attendsure.launcher")
+        self._batch_supported = True
 
-    async def launch_call(
+    async def launch_calls(
         self,
-        call_id: int,
-        phone: str,
+        calls: List[PendingCall],
         assistant_id: str,
-        variable_values: Dict[str, Any],
         schedule_at: Optional[str] = None,
-        metadata: Optional[Dict[str, Any]] = None,
     ) -> None:
+        settings = get_settings()
         # Local scheduling fallback: wait until schedule_at if configured not to use Vapi scheduler
         if schedule_at and not settings.use_vapi_scheduler:
+            await self._wait_until(schedule_at)
+        vapi_schedule_at = schedule_at if settings.use_vapi_scheduler else None
+
+        batch_size = max(1, settings.vapi_batch_size)
+        batches = [calls[i:i + batch_size] for i in range(0, len(calls), batch_size)]
+        outcomes = await asyncio.gather(
+            *(self._launch_batch(batch, assistant_id, vapi_schedule_at) for batch in batches),
+            return_exceptions=True,
+        )
+        # This runs as a background task, so surface errors here rather than losing them
+        for batch, outcome in zip(batches, outcomes):
+            if isinstance(outcome, BaseException):
+                self._logger.error(
+                    "Launch batch crashed callIds=%s error=%r", [c.call_id for c in batch], outcome
+                )
+
+    async def _wait_until(self, schedule_at: str) -> None:
+        try:
+            target = datetime.fromisoformat(schedule_at.replace("Z", "+00:00"))
+            now = datetime.now(timezone.utc)
+            # Ensure target is timezone-aware
+            if target.tzinfo is None:
+                target = target.replace(tzinfo=timezone.utc)
+            delay = (target - now).total_seconds()
+            if delay > 0:
+                self._logger.info("Delaying launch until %s (%.1fs)", target.isoformat(), delay)
+                await asyncio.sleep(delay)
+        except Exception:
+            # If parsing fails, fall through to immediate launch
+            self._logger.warning("Failed to parse scheduleAt=%s; launching immediately", schedule_at)
+
+    async def _launch_batch(
+        self,
+        batch: List[PendingCall],
+        assistant_id: str,
+        schedule_at: Optional[str],
+    ) -> None:
+        singles = batch
+        if get_settings().use_vapi_batch and self._batch_supported and len(batch) > 1:
+            singles = await self._launch_bulk(batch, assistant_id, schedule_at)
+
+        # Pipelined single requests over the shared client, throttled by the semaphore.
+        # Each call is recorded as soon as its request returns so early webhooks can match it.
+        await asyncio.gather(*(self._launch_single(c, assistant_id, schedule_at) for c in singles))
+
+    async def _launch_bulk(
+        self,
+        batch: List[PendingCall],
+        assistant_id: str,
+        schedule_at: Optional[str],
+    ) -> List[PendingCall]:
+        """Send one bulk request and record its outcome; returns the calls that still need a single request."""
+        # Results are matched back by canonical E.164 number, so a number may appear only once per bulk request
+        by_phone: Dict[str, PendingCall] = {}
+        leftovers: List[PendingCall] = []
+        for call in batch:
+            number = normalize_e164(call.phone)
+            if number in by_phone:
+                leftovers.append(call)
+            else:
+                by_phone[number] = call
+
+        customers = [
+            {"number": number, "assistantOverrides": {"variableValues": call.variable_values}}
+            for number, call in by_phone.items()
+        ]
+
+        launched: Dict[int, Optional[str]] = {}
+        failed: Dict[int, str] = {}
+        unknown: Dict[int, str] = {}
+        resp: Dict[str, Any] = {}
+        async with self._semaphore:
             try:
-                target = datetime.fromisoformat(schedule_at.replace("Z", "+00:00"))
-                now = datetime.now(timezone.utc)
-                # Ensure target is timezone-aware
-                if target.tzinfo is None:
-                    target = target.replace(tzinfo=timezone.utc)
-                delay = (target - now).total_seconds()
-                if delay > 0:
-                    self._logger.info("Delaying launch until %s (%.1fs)", target.isoformat(), delay)
-                    await asyncio.sleep(delay)
-            except Exception:
-                # If parsing fails, fall through to immediate launch
-                self._logger.warning("Failed to parse scheduleAt=%s; launching immediately", schedule_at)
+                self._logger.info("Launching call batch -> size=%s", len(customers))
+                resp = await create_outbound_calls_batch(
+                    customers=customers,
+                    assistant_id=assistant_id,
+                    schedule_at=schedule_at,
+                    phone_number_id=get_settings().vapi_phone_number_id,
+                )
+            except httpx.HTTPStatusError as e:
+                status_code = e.response.status_code
+                if status_code in _BATCH_UNSUPPORTED_STATUSES:
+                    self._batch_supported = False
+                    self._logger.warning("Batch launch unsupported (%s); using single requests", status_code)
+                    return batch
+                if status_code in _BATCH_REJECTED_STATUSES:
+                    self._logger.warning("Batch launch rejected (%s); retrying batch as single requests", status_code)
+                    return batch
+                target = failed if status_code < 500 else unknown
+                for call in by_phone.values():
+                    target[call.call_id] = str(e)
+                by_phone.clear()
+            except Exception as e:  # noqa: BLE001 - demo simplicity
+                # The provider may have accepted the request, so retrying could dial twice
+                for call in by_phone.values():
+                    unknown[call.call_id] = str(e)
+                by_phone.clear()
+                self._logger.error("Batch launch failed size=%s error=%s", len(customers), e)
+
+        for result in resp.get("results") or []:
+            call = by_phone.pop(normalize_e164((result.get("customer") or {}).get("number")), None)
+            if call:
+                launched[call.call_id] = result.get("id")
+        for error in resp.get("errors") or []:
+            call = by_phone.pop(normalize_e164((error.get("customer") or {}).get("number")), None)
+            if call:
+                failed[call.call_id] = str(error.get("error") or "Batch launch error")
+        # Possibly dialed but not matched to a returned call; do not report as failed
+        for call in by_phone.values():
+            unknown[call.call_id] = "No matching call returned by batch launch"
+
+        try:
+            with session_scope() as session:
+                mark_calls_launched(session, launched, status="in_progress")
+                mark_calls_status(session, failed, status="failed")
+                mark_calls_status(session, unknown, status="unknown")
+        except Exception as e:  # noqa: BLE001 - demo simplicity
+            # The provider already accepted these calls; record them as unknown rather than leave them queued
+            self._logger.error("Recording batch result failed size=%s error=%s", len(customers), e)
+            unknown.update(
+                {call_id: f"Launched as {vapi_call_id} but not recorded: {e}" for call_id, vapi_call_id in launched.items()}
+            )
+            launched = {}
+            self._record_status(failed, "failed")
+            self._record_status(unknown, "unknown")
+        self._logger.info(
+            "Launched call batch <- ok=%s failed=%s unknown=%s", len(launched), len(failed), len(unknown)
+        )
+        return leftovers
 
+    async def _launch_single(
+        self,
+        call: PendingCall,
+        assistant_id: str,
+        schedule_at: Optional[str],
+    ) -> None:
         async with self._semaphore:
             try:
-                self._logger.info("Launching call -> callId=%s", call_id)
+                self._logger.info("Launching call -> callId=%s", call.call_id)
                 resp = await create_outbound_call(
-                    phone=phone,
+                    phone=call.phone,
                     assistant_id=assistant_id,
-                    variable_values=variable_values,
-                    schedule_at=(schedule_at if settings.use_vapi_scheduler else None),
-                    metadata=metadata,
-                    phone_number_id=settings.vapi_phone_number_id,
+                    variable_values=call.variable_values,
+                    schedule_at=schedule_at,
+                    metadata=call.metadata,
+                    phone_number_id=get_settings().vapi_phone_number_id,
                 )
-                vapi_call_id = resp.get("id") or resp.get("call", {}).get("id")
-                with session_scope() as session:
-                    mark_call_launched(session, call_id, vapi_call_id=vapi_call_id, status="in_progress")
-                self._logger.info("Launched call <- callId=%s vapiCallId=%s", call_id, vapi_call_id)
             except Exception as e:  # noqa: BLE001 - demo simplicity
-                with session_scope() as session:
-                    mark_call_failed(session, call_id, reason=str(e))
-                self._logger.error("Launch failed callId=%s error=%s", call_id, e)
+                self._logger.error("Launch failed callId=%s error=%s", call.call_id, e)
+                self._record_status({call.call_id: str(e)}, "failed")
+                return
 
+        vapi_call_id = resp.get("id") or resp.get("call", {}).get("id")
+        try:
+            with session_scope() as session:
+                mark_call_launched(session, call.call_id, vapi_call_id=vapi_call_id, status="in_progress")
+        except Exception as e:  # noqa: BLE001 - demo simplicity
+            # Dialed but not recorded; do not report as failed or an operator may call again
+            self._logger.error("Recording launch failed callId=%s vapiCallId=%s error=%s", call.call_id, vapi_call_id, e)
+            self._record_status({call.call_id: f"Launched as {vapi_call_id} but not recorded: {e}"}, "unknown")
+            return
+        self._logger.info("Launched call <- callId=%s vapiCallId=%s", call.call_id, vapi_call_id)
 
-launcher = CallLauncher()
+    def _record_status(self, reasons: Dict[int, str], status: str) -> None:
+        """Best-effort status write in its own session; errors are logged, never raised."""
+        if not reasons:
+            return
+        try:
+            with session_scope() as session:
+                mark_calls_status(session, reasons, status=status)
+        except Exception as e:  # noqa: BLE001 - demo simplicity
+            self._logger.error("Recording status=%s failed callIds=%s error=%s", status, list(reasons), e)
 
 
+@lru_cache(maxsize=1)
+def get_launcher() -> CallLauncher:
+    return CallLauncher()
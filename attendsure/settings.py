@@ -1,26 +1,37 @@
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache
 
 from dotenv import load_dotenv
 
 
-load_dotenv()
+def _env(key: str, default: str = "") -> str:
+    return os.getenv(key, default)
 
 
-@dataclass
-class Settings:
-    vapi_api_key: str = os.getenv("VAPI_API_KEY", "")
-    vapi_assistant_id: str = os.getenv("VAPI_ASSISTANT_ID", "")
-    vapi_phone_number_id: str = os.getenv("VAPI_PHONE_NUMBER_ID", "")
-    base_url: str = os.getenv("BASE_URL", "http://localhost:8000")
-    database_url: str = os.getenv("DATABASE_URL", "sqlite:///./attendsure.db")
-    frontend_origin: str = os.getenv("FRONTEND_ORIGIN", "http://localhost:3000")
-    webhook_secret: str = os.getenv("WEBHOOK_SECRET", "")
-    concurrency_limit: int = int(os.getenv("CONCURRENCY_LIMIT", "2"))
-    environment: str = os.getenv("ENVIRONMENT", "development")
-    use_vapi_scheduler: bool = os.getenv("USE_VAPI_SCHEDULER", "true").lower() in ["1", "true", "yes"]
-
-
-settings = Settings()
+def _env_bool(key: str, default: str) -> bool:
+    return os.getenv(key, default).lower() in ["1", "true", "yes"]
 
 
+@dataclass
+class Settings:
+    # Defaults are factories so the environment is read when Settings() is built,
+    # not when this module is imported.
+    vapi_api_key: str = field(default_factory=lambda: _env("VAPI_API_KEY"))
+    vapi_assistant_id: str = field(default_factory=lambda: _env("VAPI_ASSISTANT_ID"))
+    vapi_phone_number_id: str = field(default_factory=lambda: _env("VAPI_PHONE_NUMBER_ID"))
+    base_url: str = field(default_factory=lambda: _env("BASE_URL", "http://localhost:8000"))
+    database_url: str = field(default_factory=lambda: _env("DATABASE_URL", "sqlite:///./attendsure.db"))
+    frontend_origin: str = field(default_factory=lambda: _env("FRONTEND_ORIGIN", "http://localhost:3000"))
+    webhook_secret: str = field(default_factory=lambda: _env("WEBHOOK_SECRET"))
+    concurrency_limit: int = field(default_factory=lambda: int(_env("CONCURRENCY_LIMIT", "2")))
+    environment: str = field(default_factory=lambda: _env("ENVIRONMENT", "development"))
+    use_vapi_scheduler: bool = field(default_factory=lambda: _env_bool("USE_VAPI_SCHEDULER", "true"))
+    use_vapi_batch: bool = field(default_factory=lambda: _env_bool("USE_VAPI_BATCH", "false"))
+    vapi_batch_size: int = field(default_factory=lambda: int(_env("VAPI_BATCH_SIZE", "50")))
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    load_dotenv()
+    return Settings()
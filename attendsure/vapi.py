@@ -1,16 +1,67 @@
 from __future__ import annotations
 
-import os
 import logging
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 import httpx
 
+from .settings import get_settings
+
 
 VAPI_BASE = "https://api.vapi.ai"
-VAPI_KEY = os.getenv("VAPI_API_KEY", "")
 logger = logging.getLogger("attendsure.vapi")
 
+_client: Optional[httpx.AsyncClient] = None
+
+
+def get_client() -> httpx.AsyncClient:
+    """Shared client, created on first use so connections are pooled across calls."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(base_url=VAPI_BASE, timeout=30)
+    return _client
+
+
+async def aclose_client() -> None:
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+def normalize_e164(candidate: str) -> str:
+    # Drop common separators so the same number always compares equal
+    c = "".join(ch for ch in (candidate or "") if ch not in " -().\t")
+    # If it already starts with '+', assume correct
+    if c.startswith('+'):
+        return c
+    # If it looks like digits only and 10-15 length, prefix '+'
+    if c.isdigit() and 8 <= len(c) <= 15:
+        return '+' + c
+    return c
+
+
+def _auth_headers() -> Dict[str, str]:
+    api_key = get_settings().vapi_api_key
+    if not api_key:
+        raise ValueError("VAPI_API_KEY not configured")
+    return {"Authorization": f"Bearer {api_key}"}
+
+
+def _base_call_body(
+    assistant_id: str,
+    schedule_at: Optional[str],
+    phone_number_id: Optional[str],
+) -> Dict[str, Any]:
+    if not assistant_id:
+        raise ValueError("VAPI_ASSISTANT_ID not configured")
+    body: Dict[str, Any] = {"assistantId": assistant_id, "type": "outboundPhoneCall"}
+    if schedule_at:
+        body["scheduleAt"] = schedule_at
+    if phone_number_id:
+        body["phoneNumberId"] = phone_number_id
+    return body
+
 
 async def create_outbound_call(
     phone: str,
@@ -20,38 +71,58 @@ async def create_outbound_call(
     metadata: Optional[Dict[str, Any]] = None,
     phone_number_id: Optional[str] = None,
 ) -> Dict[str, Any]:
-    if not VAPI_KEY:
-        raise ValueError("VAPI_API_KEY not configured")
-    if not assistant_id:
-        raise ValueError("VAPI_ASSISTANT_ID not configured")
-    body: Dict[str, Any] = {
+    headers = _auth_headers()
+    body = _base_call_body(assistant_id, schedule_at, phone_number_id)
+    body["customer"] = {"number": phone}
+    body["assistantOverrides"] = {"variableValues": variable_values}
+    body["metadata"] = metadata or {}
+
+    logger.info("Vapi create call -> %s", {
         "assistantId": assistant_id,
-        "type": "outboundPhoneCall",
-        "customer": {"number": phone},
-        "assistantOverrides": {"variableValues": variable_values},
-        "metadata": metadata or {},
-    }
-    if schedule_at:
-        body["scheduleAt"] = schedule_at
-    if phone_number_id:
-        body["phoneNumberId"] = phone_number_id
+        "hasScheduleAt": bool(schedule_at),
+        "hasMetadata": bool(metadata),
+        "hasVariables": bool(variable_values),
+        "phoneNumberId": phone_number_id,
+    })
+    resp = await get_client().post("/call", json=body, headers=headers)
+    if resp.status_code >= 400:
+        # Log full text for debugging
+        logger.error("Vapi error %s: %s", resp.status_code, resp.text)
+    resp.raise_for_status()
+    data = resp.json()
+    logger.info("Vapi create call <- %s", {"id": data.get("id") or data})
+    return data
 
-    headers = {"Authorization": f"Bearer {VAPI_KEY}"}
-    async with httpx.AsyncClient(timeout=30) as client:
-        logger.info("Vapi create call -> %s", {
-            "assistantId": assistant_id,
-            "hasScheduleAt": bool(schedule_at),
-            "hasMetadata": bool(metadata),
-            "hasVariables": bool(variable_values),
-            "phoneNumberId": phone_number_id,
-        })
-        resp = await client.post(f"{VAPI_BASE}/call", json=body, headers=headers)
-        if resp.status_code >= 400:
-            # Log full text for debugging
-            logger.error("Vapi error %s: %s", resp.status_code, resp.text)
-        resp.raise_for_status()
-        data = resp.json()
-        logger.info("Vapi create call <- %s", {"id": data.get("id") or data})
-        return data
 
+async def create_outbound_calls_batch(
+    customers: List[Dict[str, Any]],
+    assistant_id: str,
+    schedule_at: Optional[str] = None,
+    phone_number_id: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Create several calls in one request using the `customers` array of POST /call.
+
+    Each customer is `{"number": ..., "assistantOverrides": {...}}`. Vapi answers with
+    `{"results": [call, ...], "errors": [{"customer": ..., "error": ...}, ...]}`.
+    No metadata is sent: top-level metadata is copied onto every call in the batch.
+    """
+    headers = _auth_headers()
+    body = _base_call_body(assistant_id, schedule_at, phone_number_id)
+    body["customers"] = customers
 
+    logger.info("Vapi create call batch -> %s", {
+        "assistantId": assistant_id,
+        "size": len(customers),
+        "hasScheduleAt": bool(schedule_at),
+        "phoneNumberId": phone_number_id,
+    })
+    resp = await get_client().post("/call", json=body, headers=headers)
+    if resp.status_code >= 400:
+        logger.error("Vapi batch error %s: %s", resp.status_code, resp.text)
+    resp.raise_for_status()
+    data = resp.json()
+    logger.info("Vapi create call batch <- %s", {
+        "results": len(data.get("results") or []),
+        "errors": len(data.get("errors") or []),
+    })
+    return data
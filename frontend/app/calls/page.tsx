@@ -183,6 +183,7 @@ export default function CallsPage() {
               <option value="in_progress">In Progress</option>
               <option value="completed">Completed</option>
               <option value="failed">Failed</option>
+              <option value="unknown">Unknown</option>
             </select>
           </div>
           
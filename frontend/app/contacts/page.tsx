@@ -167,7 +167,7 @@ export default function ContactsPage() {
         if (cancelled) return
         setCallDetail(detail)
         const status = detail?.call?.status
-        if (status === 'completed' || status === 'failed') return
+        if (status === 'completed' || status === 'failed' || status === 'unknown') return
         setTimeout(tick, 3000)
         } catch {
         if (!cancelled) setTimeout(tick, 3000)